@@ -12,6 +12,8 @@ For help with commandline arguments, run `python fbmirror.py --help`
 """
 
 
+import time
+
 import click
 import numpy as np
 
@@ -49,7 +51,13 @@ def main(xoffset, yoffset, width, height, serpentine, rotation, pinout, n_planes
     matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB565, pinout=pinout, framebuffer=framebuffer, geometry=geometry)
 
     while True:
-        framebuffer[:,:] = linux_framebuffer[yoffset:yoffset+height, xoffset:xoffset+width]
+        frame = linux_framebuffer[yoffset:yoffset+height, xoffset:xoffset+width]
+        # Only redraw when the mirrored region changed; the matrix keeps showing the last frame
+        # (show() is what normally paces this loop, so wait about a frame before looking again)
+        if np.array_equal(frame, framebuffer):
+            time.sleep(1 / 60)
+            continue
+        framebuffer[:,:] = frame
         matrix.show()
 
 if __name__ == '__main__':
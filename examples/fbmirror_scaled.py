@@ -37,6 +37,8 @@ or if `/boot/firmware/cmdline.txt` specifies a resolution such as
 `...  video=HDMI-A-1:640x480M@60D`.
 """
 
+import time
+
 import click
 import numpy as np
 import PIL.Image as Image
@@ -61,6 +63,13 @@ with open("/sys/class/graphics/fb0/stride") as f:
 
 linux_framebuffer = np.memmap('/dev/fb0',mode='r', shape=(screeny, stride // bytes_per_pixel), dtype=dtype)
 
+# Lookup table giving the RGB888 equivalent of every RGB565 value
+_rgb565 = np.arange(1 << 16, dtype=np.uint16)
+_r = (_rgb565 & 0xf800) >> 8
+_g = (_rgb565 & 0x07e0) >> 3
+_b = (_rgb565 & 0x001f) << 3
+rgb565_to_rgb888 = np.stack([_r | (_r >> 5), _g | (_g >> 6), _b | (_b >> 5)], -1).astype(np.uint8)
+
 
 @click.command
 @click.option("--x-offset", "xoffset", type=int, help="The x offset of top left corner of the region to mirror",  default=0)
@@ -76,21 +85,19 @@ def main(xoffset, yoffset, scale, width, height, serpentine, rotation, pinout, n
     matrix_framebuffer = np.zeros(shape=(geometry.height, geometry.width, 3), dtype=np.uint8)
     matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed, pinout=pinout, framebuffer=matrix_framebuffer, geometry=geometry)
 
+    previous = None
     while True:
         tmp = linux_framebuffer[yoffset:yoffset + height * scale, xoffset:xoffset + width * scale]
+        # Only redraw when the mirrored region changed; the matrix keeps showing the last frame
+        # (show() is what normally paces this loop, so wait about a frame before looking again)
+        if previous is not None and np.array_equal(tmp, previous):
+            time.sleep(1 / 60)
+            continue
+        previous = tmp.copy()
         # Convert the RGB565 framebuffer into RGB888Packed (so that we can use PIL image operations to rescale it)
-        r = (tmp & 0xf800) >> 8
-        r = r | (r >> 5)
-        r = r.astype(np.uint8)
-        g = (tmp & 0x07e0) >> 3
-        g = g | (g >> 6)
-        g = g.astype(np.uint8)
-        b = (tmp & 0x001f) << 3
-        b = b | (b >> 5)
-        b = b.astype(np.uint8)
-        img = Image.fromarray(np.stack([r, g, b], -1))
-        img = img.resize((width, height))
-        matrix_framebuffer[:, :] = np.array(img)
+        img = Image.fromarray(rgb565_to_rgb888[tmp])
+        img = img.resize((width, height), Image.BOX)
+        matrix_framebuffer[:, :] = np.asarray(img)
         matrix.show()
 
 if __name__ == '__main__':
@@ -30,12 +30,27 @@ matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
                              framebuffer=framebuffer,
                              geometry=geometry)
 
+frame_interval = 0.1
+
+# Decode and composite every frame once, so the loop below only copies pixels
 with Image.open(gif_file) as img:
     print(f"frames: {img.n_frames}")
-    while True:
-        for i in range(img.n_frames):
-            img.seek(i)
-            canvas.paste(img, (0,0))
-            framebuffer[:] = np.asarray(canvas)
-            matrix.show()
-            time.sleep(0.1)
+    frames = np.empty((img.n_frames, height, width, 3), dtype=np.uint8)
+    for i in range(img.n_frames):
+        img.seek(i)
+        canvas.paste(img, (0,0))
+        frames[i] = np.asarray(canvas)
+
+deadline = time.monotonic()
+while True:
+    for frame in frames:
+        framebuffer[:] = frame
+        matrix.show()
+        # Sleep until the next frame is due, so that the time spent above
+        # doesn't add up; if we've fallen behind, start counting afresh
+        deadline += frame_interval
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            deadline = time.monotonic()
@@ -6,7 +6,8 @@ Run like this:
 
 $ python playframes.py "/path/to/images/*.png"
 
-The image files are sorted and then played repeatedly until interrupted with ctrl-c.
+The image files are sorted, loaded into memory, and then played repeatedly
+until interrupted with ctrl-c.
 """
 
 import glob
@@ -21,8 +22,13 @@ import adafruit_blinka_raspberry_pi5_piomatter as piomatter
 images = sorted(glob.glob(sys.argv[1]))
 
 geometry = piomatter.Geometry(width=64, height=32, n_addr_lines=4, rotation=piomatter.Orientation.Normal)
-framebuffer = np.asarray(Image.open(images[0])) + 0  # Make a mutable copy
 nimages = len(images)
+# Decode every image once, up front, into one contiguous array of frames
+first_frame = np.asarray(Image.open(images[0]))
+frames = np.empty((nimages, *first_frame.shape), dtype=np.uint8)
+for i, filename in enumerate(images):
+    frames[i] = np.asarray(Image.open(filename))
+framebuffer = frames[0] + 0  # Make a mutable copy
 matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
                              pinout=piomatter.Pinout.AdafruitMatrixBonnet,
                              framebuffer=framebuffer,
@@ -30,8 +36,8 @@ matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
 
 while True:
     t0 = time.monotonic()
-    for i in images:
-        framebuffer[:] = np.asarray(Image.open(i))
+    for frame in frames:
+        framebuffer[:] = frame
         matrix.show()
     t1 = time.monotonic()
     dt = t1 - t0
@@ -43,11 +43,17 @@ draw = ImageDraw.Draw(full_txt_img)
 draw.text((3, 3), text, font=font, fill=font_color)
 full_txt_img.save("quote.png")
 
-single_frame_img = Image.new("RGB", (total_width, total_height), (0, 0, 0))
+# Pad the rendered text with a screen's worth of black on either side so that
+# every frame of the scroll is a plain slice of this array
+scroll_offset = total_width + 1
+txt_array = np.asarray(full_txt_img)
+txt_rows = min(txt_array.shape[0], total_height)
+scroll_array = np.zeros((total_height, scroll_offset + txt_array.shape[1] + total_width, 3), dtype=np.uint8)
+scroll_array[:txt_rows, scroll_offset:scroll_offset + txt_array.shape[1]] = txt_array[:txt_rows]
 
 geometry = piomatter.Geometry(width=total_width, height=total_height,
                               n_addr_lines=4, rotation=piomatter.Orientation.Normal)
-framebuffer = np.asarray(single_frame_img) + 0  # Make a mutable copy
+framebuffer = np.zeros((total_height, total_width, 3), dtype=np.uint8)
 
 matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
                              pinout=piomatter.Pinout.AdafruitMatrixBonnet,
@@ -57,15 +63,15 @@ matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed,
 print("Ctrl-C to exit")
 while True:
     for x_pixel in range(-total_width-1,full_txt_img.width):
+        x_start = x_pixel + scroll_offset
         if bottom_half_shift_compensation == 0:
-            # full paste
-            single_frame_img.paste(full_txt_img.crop((x_pixel, 0, x_pixel + total_width, total_height)), (0, 0))
+            # full copy
+            framebuffer[:] = scroll_array[:, x_start:x_start + total_width]
 
         else:
             # top half
-            single_frame_img.paste(full_txt_img.crop((x_pixel, 0, x_pixel + total_width, total_height//2)), (0, 0))
+            framebuffer[:total_height//2] = scroll_array[:total_height//2, x_start:x_start + total_width]
             # bottom half shift compensation
-            single_frame_img.paste(full_txt_img.crop((x_pixel, total_height//2, x_pixel + total_width, total_height)), (bottom_half_shift_compensation, total_height//2))
+            framebuffer[total_height//2:, bottom_half_shift_compensation:] = scroll_array[total_height//2:, x_start:x_start + total_width - bottom_half_shift_compensation]
 
-        framebuffer[:] = np.asarray(single_frame_img)
         matrix.show()
@@ -69,6 +69,9 @@ def darken_color(hex_color, darkness_factor):
 step_count = 4
 darkness_factor = 0.5
 
+# The darkened color for every color_index, computed once instead of per circle
+colorwheel_lut = [darken_color(rainbowio.colorwheel(i), darkness_factor) for i in range(256)]
+
 clearing = False
 
 try:
@@ -79,22 +82,22 @@ try:
             step_down_size = step * (pen_radius* 2) + (2 * step)
             for x in range(pen_radius + step_down_size, width - pen_radius - step_down_size - 1):
                 color_index = (color_index + 2) % 256
-                color = darken_color(rainbowio.colorwheel(color_index), darkness_factor) if not clearing else 0x000000
+                color = colorwheel_lut[color_index] if not clearing else 0x000000
                 draw.circle((x, pen_radius + step_down_size), pen_radius, color)
                 update_matrix()
             for y in range(pen_radius + step_down_size, height - pen_radius - step_down_size - 1):
                 color_index = (color_index + 2) % 256
-                color = darken_color(rainbowio.colorwheel(color_index), darkness_factor) if not clearing else 0x000000
+                color = colorwheel_lut[color_index] if not clearing else 0x000000
                 draw.circle((width - pen_radius - step_down_size -1, y), pen_radius, color)
                 update_matrix()
             for x in range(width - pen_radius - step_down_size - 1, pen_radius + step_down_size, -1):
                 color_index = (color_index + 2) % 256
-                color = darken_color(rainbowio.colorwheel(color_index), darkness_factor) if not clearing else 0x000000
+                color = colorwheel_lut[color_index] if not clearing else 0x000000
                 draw.circle((x, height - pen_radius - step_down_size - 1), pen_radius, color)
                 update_matrix()
             for y in range(height - pen_radius - step_down_size - 1, pen_radius + ((step+1) * (pen_radius* 2) + (2 * (step+1))) -1, -1):
                 color_index = (color_index + 2) % 256
-                color = darken_color(rainbowio.colorwheel(color_index), darkness_factor) if not clearing else 0x000000
+                color = colorwheel_lut[color_index] if not clearing else 0x000000
                 draw.circle((pen_radius + step_down_size, y), pen_radius, color)
                 update_matrix()
 
@@ -102,8 +105,7 @@ try:
                 # connect to next iter
                 for x in range(pen_radius + step_down_size, pen_radius + ((step+1) * (pen_radius* 2) + (2 * (step+1)))):
                     color_index = (color_index + 2) % 256
-                    color = darken_color(rainbowio.colorwheel(color_index),
-                                         darkness_factor) if not clearing else 0x000000
+                    color = colorwheel_lut[color_index] if not clearing else 0x000000
                     draw.circle((x, pen_radius + ((step+1) * (pen_radius* 2) + (2 * (step+1)))), pen_radius, color)
                     update_matrix()
 
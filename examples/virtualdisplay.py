@@ -21,11 +21,12 @@ Here's an example for running an emulator using a rom stored in "/tmp/snesrom.sm
 """
 
 import shlex
+import time
 from subprocess import Popen
 
 import click
 import numpy as np
-from PIL import ImageEnhance
+from PIL import Image
 from pyvirtualdisplay.smartdisplay import SmartDisplay
 
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
@@ -61,17 +62,28 @@ def main(scale, backend, use_xauth, extra_args, rfbport, brightness, width, heig
     framebuffer = np.zeros(shape=(geometry.height, geometry.width, 3), dtype=np.uint8)
     matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed, pinout=pinout, framebuffer=framebuffer, geometry=geometry)
 
+    # Scale the brightness of the (already resized) image with a lookup table
+    brightness_lut = None
+    if brightness != 1.0:
+        brightness_lut = (np.arange(256) * brightness).astype(np.uint8)
+
     with SmartDisplay(backend=backend, use_xauth=use_xauth, size=(round(width*scale),round(height*scale)), manage_global_env=False, **kwargs) as disp, Popen(command, env=disp.env()) as proc:
             while proc.poll() is None:
                 img = disp.grab(autocrop=False)
 
                 if img is None:
                     continue
-                if brightness != 1.0:
-                    darkener = ImageEnhance.Brightness(img)
-                    img = darkener.enhance(brightness)
-                img = img.resize((width, height))
-                framebuffer[:, :] = np.array(img)
+                if img.size != (width, height):
+                    img = img.resize((width, height), Image.BILINEAR)
+                frame = np.asarray(img)
+                if brightness_lut is not None:
+                    frame = brightness_lut[frame]
+                # Only redraw when the screen changed; the matrix keeps showing the last frame
+                # (show() is what normally paces this loop, so wait about a frame before looking again)
+                if np.array_equal(frame, framebuffer):
+                    time.sleep(1 / 60)
+                    continue
+                framebuffer[:, :] = frame
                 matrix.show()
 if __name__ == '__main__':
     main()
@@ -18,9 +18,11 @@ This example command will mirror a 128x128 pixel square from the top left of the
     $  python xdisplay_mirror.py --pinout AdafruitMatrixHatBGR --width 128 --height 128 --serpentine --num-address-lines 5 --num-planes 8 --mirror-region 0,0,128,128
 """
 
+import time
+
 import click
 import numpy as np
-from PIL import Image, ImageEnhance, ImageGrab
+from PIL import Image, ImageGrab
 
 import adafruit_blinka_raspberry_pi5_piomatter as piomatter
 import adafruit_blinka_raspberry_pi5_piomatter.click as piomatter_click
@@ -58,6 +60,11 @@ def main(width, height, serpentine, rotation, pinout, n_planes,
     matrix = piomatter.PioMatter(colorspace=piomatter.Colorspace.RGB888Packed, pinout=pinout, framebuffer=framebuffer,
                                  geometry=geometry)
 
+    # Scale the brightness of the (already resized) image with a lookup table
+    brightness_lut = None
+    if brightness != 1.0:
+        brightness_lut = (np.arange(256) * brightness).astype(np.uint8)
+
     if mirror_region:
         mirror_region = tuple(int(_) for _ in mirror_region.split(','))
     else:
@@ -71,12 +78,18 @@ def main(width, height, serpentine, rotation, pinout, n_planes,
             img = img.crop((mirror_region[0], mirror_region[1],    # left,top
                             mirror_region[0] + mirror_region[2],   # right
                             mirror_region[1] + mirror_region[3]))  # bottom
-        if brightness != 1.0:
-            darkener = ImageEnhance.Brightness(img)
-            img = darkener.enhance(brightness)
-        img = img.resize((width, height), RESAMPLE_MAP[resample_method])
-
-        framebuffer[:, :] = np.array(img)
+        if img.size != (width, height):
+            img = img.resize((width, height), RESAMPLE_MAP[resample_method])
+
+        frame = np.asarray(img)
+        if brightness_lut is not None:
+            frame = brightness_lut[frame]
+        # Only redraw when the screen changed; the matrix keeps showing the last frame
+        # (show() is what normally paces this loop, so wait about a frame before looking again)
+        if np.array_equal(frame, framebuffer):
+            time.sleep(1 / 60)
+            continue
+        framebuffer[:, :] = frame
         matrix.show()
 
 if __name__ == '__main__':
@@ -16,8 +16,9 @@ ext_modules = [
         define_macros = [('VERSION_INFO', __version__)],
         include_dirs = ['./src/include', './src/piolib/include'],
         cxx_std=20,
-        # use this setting when debugging
-        extra_compile_args = ["-g3", "-Og"],
+        # optimize the per-frame convert/render loops; when debugging,
+        # use ["-g3", "-Og"] instead
+        extra_compile_args = ["-O3"],
         ),
 ]
 
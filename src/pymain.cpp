@@ -29,6 +29,19 @@ struct PyPiomatter {
     double fps() const { return matter->fps; }
 };
 
+// The driver reads the framebuffer as one flat run of pixels, so any padding
+// or reordering between rows/elements would be displayed as garbage
+bool is_c_contiguous(const py::buffer_info &info) {
+    py::ssize_t expected_stride = info.itemsize;
+    for (py::ssize_t i = info.ndim - 1; i >= 0; i--) {
+        if (info.shape[i] != 1 && info.strides[i] != expected_stride) {
+            return false;
+        }
+        expected_stride *= info.shape[i];
+    }
+    return true;
+}
+
 template <typename pinout, typename colorspace>
 std::unique_ptr<PyPiomatter>
 make_piomatter_pc(py::buffer buffer,
@@ -49,6 +62,10 @@ make_piomatter_pc(py::buffer buffer,
                                 std::size(pinout::PIN_RGB) / 3)
                 .template cast<std::string>());
     }
+    if (!is_c_contiguous(info)) {
+        throw std::runtime_error("Framebuffer must be C-contiguous (use e.g., "
+                                 "numpy.ascontiguousarray)");
+    }
     if (buffer_size_in_bytes != data_size_in_bytes) {
         throw std::runtime_error(
             py::str("Framebuffer size must be {} bytes ({} elements of {} "
@@ -273,6 +290,7 @@ support different hardware breakouts and panels with different color order. The
 value must be one of the `Pinout` constants.
 
 ``framebuffer`` a numpy array that holds pixel data in the appropriate colorspace.
+It must be C-contiguous, because the driver reads it in place on every ``show()``.
 
 ``geometry`` controls the size and shape of the panel. The value must be a `Geometry`
 instance.